@@ -1,14 +1,39 @@
 import yfinance as yf
+import numpy as np
 import requests
+import orjson
 import os
-from bs4 import BeautifulSoup
+import re
+import hashlib
+import time
+import pickle
+import socket
+import threading
+import lxml.html
+from lxml import etree
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # --- 設定區 ---
 
 DISCORD_WEBHOOK_URL = os.environ.get('DISCORD_WEBHOOK')
 NICKEL_URL = "https://markets.businessinsider.com/commodities/nickel-price"
 
+# 鎳價快速路徑：直接對原始 HTML 取出 現價 / 漲跌幅，省去建立整棵 DOM
+_NICKEL_RE = re.compile(
+    rb'price-section__current-value[^>]*>\s*([\d,\.]+)\s*<.*?price-section__relative-value[^>]*>\s*([+-]?[\d\.]+)\s*%',
+    re.S,
+)
+
+# 鎳價備援解析：依 class 找 <span> (預先編譯的 XPath)
+_SPAN_BY_CLASS = etree.XPath('//span[contains(concat(" ", normalize-space(@class), " "), concat(" ", $cls, " "))]')
+
+# 數字清理：一次移除千分位、百分號與各種空白 (含 \xa0 / 全形空白)
+_NUM_CLEAN = str.maketrans('', '', ',%\xa0 \t\n\r\u3000')
+
 # 趨勢判斷代理：DBB (Invesco DB Base Metals Fund)
 # 用它來計算 MA20, MA60，判斷原物料大趨勢
 TREND_PROXY_TICKER = "DBB"
@@ -21,93 +46,264 @@ STOCK_LIST = [
     {"id": "2027.TW", "name": "大成鋼", "tag": "美鋁通路"},
 ]
 
+# 共用連線池：Discord / Business Insider 重複使用 TCP+TLS 連線，並自動重試
+SESSION = requests.Session()
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'br, gzip, deflate',
+})
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+))
+
+# 均線趨勢對照表，索引 = (價格 > 月線) << 1 | (月線 > 季線)
+_TREND = (
+    ("空頭排列 (弱勢)", "🐻"),  # 0: 價格 < 月線 < 季線 (最弱)
+    ("跌破月線 (整理)", "📉"),  # 1: 價格 < 月線，但 月線 > 季線 (回檔)
+    ("站上月線 (反彈)", "📈"),  # 2: 價格 > 月線，但 月線 < 季線 (短多)
+    ("多頭排列 (強勢)", "🚀"),  # 3: 價格 > 月線 > 季線 (最強)
+)
+_TREND_BULL = 3
+
+# 各趨勢對應的策略建議 (索引同 _TREND)
+_TREND_STRATEGY = (
+    "`空頭走勢，保守觀望` ⛔",
+    "`區間震盪，低買高賣` 🔄",
+    "`反彈行情，短線操作` ⚠️",
+    "`順勢做多，拉回找買點` ✅",
+)
+
+# 報告各區塊模板 (一次 format_map 產生整段文字)
+_NICKEL_TEMPLATE = """\
+> 現價: `{price:,.0f}` USD
+> 漲跌: `{pct_sign} {change_pct}%`"""
+
+_TREND_TEMPLATE = """\
+> 狀態: **{status}**
+> 均線: 月線 {ma20:.2f} | 季線 {ma60:.2f}
+> 策略: {strategy}"""
+
+# 台股表格每列的固定欄位：(代號, 顯示代碼, 名稱, 特性)
+_STOCK_ROWS = [(s['id'], s['id'].replace('.TW', ''), s['name'], s['tag']) for s in STOCK_LIST]
+
+# 台股表格表頭 (固定內容，只組一次)
+_TABLE_HEADER = f"{'代號':<5} {'名稱':<4} {'現價':>6} {'漲跌%':>7} {'張數':>5}  {'特性'}\n" + "-" * 42
+
+# 本機快取目錄：同一交易日重跑時，直接讀取上次抓到的行情
+CACHE_DIR = os.environ.get('CACHE_DIR', '.cache')
+
+# 相同報告在此秒數內不重複發送到 Discord
+DISCORD_DEDUP_TTL = 3600
+
+# yf.Ticker 物件快取 (程序內共用，避免重複初始化)
+_TICKERS = {}
+
 # --- 函數區 ---
 
-def send_discord_message(content):
+def _tk(symbol):
+    """ 取得 (並記住) symbol 對應的 yf.Ticker """
+    ticker = _TICKERS.get(symbol)
+    if ticker is None:
+        ticker = yf.Ticker(symbol)
+        _TICKERS[symbol] = ticker
+    return ticker
+
+def _cached(key, ttl, fetch):
+    """ 檔案快取 (pickle)：ttl 秒內直接回傳上次結果，否則呼叫 fetch() 並寫回 """
+    path = os.path.join(CACHE_DIR, f"{key}.pkl")
+    try:
+        fresh = time.time() - os.path.getmtime(path) < ttl
+    except OSError:
+        fresh = False
+    if fresh:
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            # 檔案損毀或套件升級後無法還原 (AttributeError / ModuleNotFoundError ...)，當作未命中
+            print(f"快取無法讀取，重新抓取: {e}")
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    value = fetch()
+    # 抓取失敗 (None 或空表) 不寫入快取，下次重跑會再抓一次
+    if value is None or getattr(value, 'empty', False):
+        return value
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(value, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"寫入快取失敗: {e}")
+    return value
+
+def _prewarm():
+    """ 預先解析各來源 DNS，並先與 Discord 建好 TLS 連線 (留在 SESSION 連線池) """
+    hosts = ['markets.businessinsider.com', 'query1.finance.yahoo.com', 'query2.finance.yahoo.com']
+    discord_host = urlsplit(DISCORD_WEBHOOK_URL).netloc if DISCORD_WEBHOOK_URL else None
+    if discord_host:
+        hosts.append(discord_host)
+    for host in hosts:
+        try:
+            socket.getaddrinfo(host, 443)
+        except OSError:
+            pass
+    # 報告最後才送 Discord，趁抓資料期間先完成握手
+    if discord_host:
+        try:
+            SESSION.head(f"https://{discord_host}/", timeout=5)
+        except requests.RequestException:
+            pass
+
+def send_discord_message(title, fields, content="", bullish=False):
+    """ 以單一 embed 發送報告 (fields: 區塊標題 -> 內容) """
     if not DISCORD_WEBHOOK_URL:
         print("⚠️ 未設定 Discord Webhook URL")
         return
-    data = {"content": content, "username": "不銹鋼戰情室"}
+    data = {
+        "username": "不銹鋼戰情室",
+        "content": content,
+        "embeds": [{
+            "title": title,
+            "color": 0xFF4444 if bullish else 0x888888,
+            "fields": [{"name": name, "value": value, "inline": False} for name, value in fields.items()],
+        }],
+    }
+    body = orjson.dumps(data)
+
+    # 與上次送出的內容相同 (且仍在有效期內) 就不再通知
+    digest = hashlib.sha1(body).hexdigest()
+    last_path = os.path.join(CACHE_DIR, "discord_last.json")
+    try:
+        with open(last_path, 'rb') as f:
+            last = orjson.loads(f.read())
+        if last.get("digest") == digest and time.time() < last.get("fresh_until", 0):
+            print("內容未變動，略過 Discord 發送")
+            return
+    except (OSError, orjson.JSONDecodeError):
+        pass
+
     try:
-        requests.post(DISCORD_WEBHOOK_URL, json=data).raise_for_status()
+        SESSION.post(
+            DISCORD_WEBHOOK_URL,
+            data=body,
+            headers={'Content-Type': 'application/json'},
+            timeout=10,
+        ).raise_for_status()
         print("Discord 發送成功")
     except Exception as err:
         print(f"Discord 發送失敗: {err}")
+        return
 
-def get_nickel_price():
-    """ 抓取即時鎳價 (Business Insider) """
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept-Language': 'en-US,en;q=0.9',
-        }
-        response = requests.get(NICKEL_URL, headers=headers, timeout=10)
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(last_path, 'wb') as f:
+            f.write(orjson.dumps({"digest": digest, "fresh_until": time.time() + DISCORD_DEDUP_TTL}))
+    except OSError as e:
+        print(f"寫入發送紀錄失敗: {e}")
+
+def _fetch_nickel_html():
+    """ 下載 Business Insider 鎳價頁面 (bytes)，網路錯誤時回傳 None """
+    try:
+        response = SESSION.get(NICKEL_URL, timeout=10)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        price_div = soup.find('span', class_='price-section__current-value')
-        if not price_div: price_div = soup.find('span', class_='push-data')
-        if not price_div: return None
-            
-        current_price = float(price_div.text.replace(',', ''))
-        
-        change_pct = 0.0
-        try:
-            pct_div = soup.find('span', class_='price-section__relative-value')
-            if pct_div: change_pct = float(pct_div.text.replace('%', '').strip())
-        except: pass 
+        return response.content
+    except requests.RequestException as e:
+        print(f"爬取鎳價失敗: {e}")
+        return None
 
+def _parse_nickel(html):
+    """ 從頁面 HTML 取出 現價 / 漲跌幅，找不到價格時回傳 None """
+    if not html.strip():
+        return None
+
+    m = _NICKEL_RE.search(html)
+    if m:
         return {
-            "price": current_price,
-            "change_pct": change_pct,
+            "price": float(m.group(1).translate(None, b',')),
+            "change_pct": float(m.group(2)),
             "date": datetime.now().strftime('%Y-%m-%d')
         }
-    except Exception as e:
-        print(f"爬取鎳價失敗: {e}")
+
+    # 版面變動時退回完整解析；直接交 bytes 給 lxml (C 實作)，由它處理編碼
+    tree = lxml.html.fromstring(html)
+
+    price_div = _SPAN_BY_CLASS(tree, cls='price-section__current-value') or _SPAN_BY_CLASS(tree, cls='push-data')
+    if not price_div:
+        return None
+
+    current_price = float(price_div[0].text_content().translate(_NUM_CLEAN))
+
+    # 漲跌幅讀不到時視為 0，仍保留現價
+    change_pct = 0.0
+    pct_div = _SPAN_BY_CLASS(tree, cls='price-section__relative-value')
+    pct_text = pct_div[0].text_content().translate(_NUM_CLEAN) if pct_div else ""
+    if pct_text:
+        try:
+            change_pct = float(pct_text)
+        except ValueError:
+            pass
+
+    return {
+        "price": current_price,
+        "change_pct": change_pct,
+        "date": datetime.now().strftime('%Y-%m-%d')
+    }
+
+def _scrape_nickel():
+    """ 下載並解析鎳價頁面，任一步失敗回傳 None """
+    html = _fetch_nickel_html()
+    if html is None:
         return None
+    try:
+        return _parse_nickel(html)
+    except (ValueError, etree.LxmlError) as e:
+        print(f"解析鎳價失敗: {e}")
+        return None
+
+def get_nickel_price():
+    """ 抓取即時鎳價 (Business Insider)，15 分鐘內重跑直接使用快取 """
+    today = datetime.now().strftime('%Y%m%d')
+    return _cached(f"nickel_{today}", 900, _scrape_nickel)
 
 def get_market_trend():
     """ 
     使用 DBB ETF 計算技術指標 (均線)
-    回傳: 趨勢狀態字串, MA20數值, MA60數值
+    回傳: 趨勢狀態字串, 趨勢索引 (見 _TREND), MA20數值, MA60數值
     """
     try:
-        # 抓取過去 4 個月的資料來算 MA60
-        etf = yf.Ticker(TREND_PROXY_TICKER)
-        hist = etf.history(period="4mo")
-        
+        # 抓取過去 4 個月的還原收盤價來算 MA60 (3 個月有時只剩剛好 60 個交易日)，不取股利/分割欄位
+        # DBB 每年 12 月配息，未還原的收盤價會出現假跌幅，均線需用還原價
+        # 盤中手動執行時最後一根是即時價，快取只保留 30 分鐘，避免收盤後的排程沿用
+        today = datetime.now().strftime('%Y%m%d')
+        hist = _cached(f"{TREND_PROXY_TICKER}_4mo_adjclose_{today}", 1800, lambda: _tk(TREND_PROXY_TICKER).history(
+            period="4mo", actions=False, rounding=True)['Close'])
+
         if len(hist) < 60:
-            return "資料不足", 0, 0
+            print(f"趨勢資料不足: 僅 {len(hist)} 筆")
+            return None
 
-        # 計算均線
-        price = hist['Close'].iloc[-1]
-        ma5 = hist['Close'].tail(5).mean()
-        ma20 = hist['Close'].tail(20).mean() # 月線
-        ma60 = hist['Close'].tail(60).mean() # 季線
+        # 計算均線 (直接在 ndarray 上切片，不產生新的 Series)
+        closes = hist.to_numpy(dtype=np.float64)
+        price = closes[-1]
+        ma5 = closes[-5:].mean()
+        ma20 = closes[-20:].mean() # 月線
+        ma60 = closes[-60:].mean() # 季線
         
-        # 趨勢邏輯判斷
-        trend_status = "盤整中"
-        trend_emoji = "⚖️"
-        
-        # 1. 多頭排列 (最強): 價格 > 月線 > 季線
-        if price > ma20 and ma20 > ma60:
-            trend_status = "多頭排列 (強勢)"
-            trend_emoji = "🚀"
-        # 2. 短多 (反彈): 價格 > 月線，但 月線 < 季線
-        elif price > ma20 and ma20 < ma60:
-            trend_status = "站上月線 (反彈)"
-            trend_emoji = "📈"
-        # 3. 空頭排列 (最弱): 價格 < 月線 < 季線
-        elif price < ma20 and ma20 < ma60:
-            trend_status = "空頭排列 (弱勢)"
-            trend_emoji = "🐻"
-        # 4. 跌破月線 (回檔): 價格 < 月線，但 月線 > 季線
-        elif price < ma20 and ma20 > ma60:
-            trend_status = "跌破月線 (整理)"
-            trend_emoji = "📉"
-            
+        # 趨勢邏輯判斷：以 (價格 > 月線, 月線 > 季線) 兩個位元查表
+        trend = (int(price > ma20) << 1) | int(ma20 > ma60)
+        trend_status, trend_emoji = _TREND[trend]
+
         return {
             "status": f"{trend_emoji} {trend_status}",
+            "trend": trend,
             "ma20": ma20,
             "ma60": ma60,
             "price": price
@@ -116,103 +312,107 @@ def get_market_trend():
         print(f"趨勢計算失敗: {e}")
         return None
 
+def _nth_last_valid(values, n):
+    """ 每欄倒數第 n 筆非 NaN 的值，不足 n 筆的欄位回傳 NaN """
+    valid = ~np.isnan(values)
+    # remaining[i, j]: 第 j 欄從第 i 列到最後共有幾筆有效值
+    remaining = np.cumsum(valid[::-1], axis=0)[::-1]
+    hit = valid & (remaining == n)
+    return np.where(hit.any(axis=0), np.where(hit, values, 0.0).sum(axis=0), np.nan)
+
 def get_tw_stocks_status():
     """ 獲取台股狀態 (含特性標籤) """
-    table_lines = []
-    header = f"{'代號':<5} {'名稱':<4} {'現價':>6} {'漲跌%':>7} {'張數':>5}  {'特性'}"
-    table_lines.append(header)
-    table_lines.append("-" * 42)
-
-    for stock_info in STOCK_LIST:
-        symbol = stock_info['id']
-        name = stock_info['name']
-        tag = stock_info['tag']
-        
-        try:
-            stock = yf.Ticker(symbol)
-            data = stock.history(period="5d")
-            
-            if len(data) >= 1:
-                price = data['Close'].iloc[-1]
-                volume = 0
-                if 'Volume' in data.columns: volume = int(data['Volume'].iloc[-1] / 1000)
-                
-                stock_code = symbol.replace('.TW', '')
-                change_str = "0.00%"
-                if len(data) >= 2:
-                    prev = data['Close'].iloc[-2]
-                    change = ((price - prev) / prev) * 100
-                    sign = "+" if change > 0 else ""
-                    change_str = f"{sign}{change:.2f}%"
-                
-                line = f"{stock_code:<5} {name:<4} {price:>6.2f} {change_str:>7} {volume:>5}  {tag}"
-                table_lines.append(line)
-            else:
-                table_lines.append(f"{symbol} 無資料")
-        except:
-            table_lines.append(f"{symbol} 讀取錯誤")
-            
+    table_lines = [_TABLE_HEADER]
+
+    # 一次批次下載全部個股，每檔一條執行緒同時抓取 (threads=True 的上限是 CPU 數 x2，核心少的機器可能不足一檔一條)
+    tickers = [symbol for symbol, _, _, _ in _STOCK_ROWS]
+    today = datetime.now().strftime('%Y%m%d')
+    try:
+        all_data = _cached(f"tw_stocks_5d_cols_{today}", 1800, lambda: yf.download(
+            tickers, period="5d", group_by='column', threads=len(tickers), progress=False, auto_adjust=False))
+
+        # 整張表一次向量化計算 (欄位順序同 _STOCK_ROWS)，迴圈只負責排版
+        # 個股停牌或 Yahoo 某檔資料延遲時，最後一列是 NaN：漲跌幅要用各檔最後兩筆有效收盤價
+        closes = all_data['Close'].reindex(columns=tickers).to_numpy(dtype=np.float64)
+        vols = all_data['Volume'].reindex(columns=tickers).ffill().to_numpy(dtype=np.float64)
+        last_price = _nth_last_valid(closes, 1)
+        prev_price = _nth_last_valid(closes, 2)
+        pct = (last_price - prev_price) / prev_price * 100
+        last_vol = np.nan_to_num(vols[-1] / 1000)
+    except (KeyError, IndexError, ValueError) as e:
+        # yf.download 內部吞掉連線錯誤並回傳空表：缺 Close 欄 (KeyError) 或沒有任何列 (IndexError) 都在這裡處理
+        print(f"台股資料讀取失敗: {e}")
+        table_lines.extend(f"{symbol} 讀取錯誤" for symbol in tickers)
+        return "\n".join(table_lines)
+
+    for i, (symbol, stock_code, name, tag) in enumerate(_STOCK_ROWS):
+        price = last_price[i]
+        if np.isnan(price):
+            table_lines.append(f"{symbol} 無資料")
+            continue
+
+        volume = int(last_vol[i])
+        change = pct[i]
+        change_str = "0.00%"
+        if not np.isnan(change):
+            sign = "+" if change > 0 else ""
+            change_str = f"{sign}{change:.2f}%"
+
+        line = f"{stock_code:<5} {name:<4} {price:>6.2f} {change_str:>7} {volume:>5}  {tag}"
+        table_lines.append(line)
+
     return "\n".join(table_lines)
 
 # --- 主程式 ---
 
 def main():
     print("開始執行策略分析...")
-    
-    nickel_data = get_nickel_price()
-    market_trend = get_market_trend()
-    
-    message = ""
+    threading.Thread(target=_prewarm, daemon=True).start()
+
+    # 三個資料來源彼此獨立 (Business Insider / Yahoo)，同時抓取以縮短等待時間
+    # 各函數內部自行處理例外，單一來源失敗不影響其他來源
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        f_nickel = executor.submit(get_nickel_price)
+        f_trend = executor.submit(get_market_trend)
+        f_stocks = executor.submit(get_tw_stocks_status)
+        nickel_data = f_nickel.result()
+        market_trend = f_trend.result()
+        stocks_text = f_stocks.result()
     
     # 判斷整體氣氛 (結合 鎳價漲跌 + 市場均線)
     is_bullish_price = nickel_data and nickel_data['change_pct'] > 1.0
-    is_bullish_trend = market_trend and "多頭" in market_trend['status']
-    
+    is_bullish_trend = market_trend and market_trend['trend'] == _TREND_BULL
+
+    # --- 0. 訊號總結 (@here 只在 content 才會通知) ---
+    alert = ""
+    if is_bullish_price and is_bullish_trend:
+        alert = "@here **🚀 強力訊號：鎳價大漲 + 趨勢多頭！全力留意！**"
+    elif is_bullish_price and not is_bullish_trend:
+        alert = "@here **⚠️ 注意：鎳價反彈，但大趨勢仍偏空 (搶短請小心)**"
+
     title_emoji = "🔥" if (is_bullish_price and is_bullish_trend) else "📊"
-    
-    message += f"{title_emoji} **鎳價策略戰情室** ({datetime.now().strftime('%Y-%m-%d')})\n\n"
+    title = f"{title_emoji} 鎳價策略戰情室 ({datetime.now().strftime('%Y-%m-%d')})"
+
+    fields = {}
 
     # --- 1. 即時報價區 ---
     if nickel_data:
         # 簡單判斷漲跌符號
         pct_sign = "🔺" if nickel_data['change_pct'] > 0 else "🔻"
-        message += f"**🔩 LME 鎳價 (Spot)**\n"
-        message += f"> 現價: `{nickel_data['price']:,.0f}` USD\n"
-        message += f"> 漲跌: `{pct_sign} {nickel_data['change_pct']}%`\n"
+        fields["🔩 LME 鎳價 (Spot)"] = _NICKEL_TEMPLATE.format_map(dict(nickel_data, pct_sign=pct_sign))
     else:
-        message += f"**🔩 LME 鎳價**: `讀取失敗` (請檢查 Business Insider)\n"
+        fields["🔩 LME 鎳價"] = "`讀取失敗` (請檢查 Business Insider)"
 
     # --- 2. 技術趨勢區 (新功能) ---
     if market_trend:
-        message += f"**🌊 原物料趨勢 (DBB ETF)**\n"
-        message += f"> 狀態: **{market_trend['status']}**\n"
-        message += f"> 均線: 月線 {market_trend['ma20']:.2f} | 季線 {market_trend['ma60']:.2f}\n"
-        message += f"> 策略: "
-        
         # 根據均線給出簡單策略建議
-        if "多頭" in market_trend['status']:
-            message += "`順勢做多，拉回找買點` ✅\n"
-        elif "站上月線" in market_trend['status']:
-            message += "`反彈行情，短線操作` ⚠️\n"
-        elif "空頭" in market_trend['status']:
-            message += "`空頭走勢，保守觀望` ⛔\n"
-        else:
-            message += "`區間震盪，低買高賣` 🔄\n"
-    message += "\n"
+        strategy = _TREND_STRATEGY[market_trend['trend']]
+        fields["🌊 原物料趨勢 (DBB ETF)"] = _TREND_TEMPLATE.format_map(dict(market_trend, strategy=strategy))
 
     # --- 3. 台股區 ---
-    message += f"**🏭 不銹鋼個股表現**\n"
-    message += "```yaml\n"
-    message += get_tw_stocks_status()
-    message += "\n```"
-    
-    # --- 4. 訊號總結 ---
-    if is_bullish_price and is_bullish_trend:
-        message = "@here **🚀 強力訊號：鎳價大漲 + 趨勢多頭！全力留意！**\n" + message
-    elif is_bullish_price and not is_bullish_trend:
-        message = "@here **⚠️ 注意：鎳價反彈，但大趨勢仍偏空 (搶短請小心)**\n" + message
+    fields["🏭 不銹鋼個股表現"] = f"```yaml\n{stocks_text}\n```"
 
-    send_discord_message(message)
+    send_discord_message(title, fields, content=alert, bullish=is_bullish_price and is_bullish_trend)
 
 if __name__ == "__main__":
     main()